@@ -1,12 +1,45 @@
-import json
+import asyncio
+import hashlib
 import logging
+import random
+import re
 import traceback
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from string import ascii_lowercase
-from typing import Generator, Callable, Dict, List
-
-from requests_html import HTMLSession, AsyncHTMLSession, HTML, Element
+from typing import Dict, Iterator, List, Tuple
+
+import diskcache
+import httpx
+import orjson
+import requests_cache
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+
+try:
+    # libuv event loop, noticeably faster for many small requests.
+    # Not available on Windows, so the default loop is the fallback
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
 logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _parse_page(page: str) -> List[Tuple[str, Dict]]:
+    """
+    Parses a single page into (word, info) pairs.
+    Module level so ProcessPoolExecutor can pickle it. The parse path only
+    touches class-level state, so workers need no instance of their own.
+
+    :type page: str
+    :param page: Page content
+    :rtype: List[Tuple[str, Dict]]
+    :return: List of (word, {'part_of_speech': [], definition: ''}) pairs
+    """
+    return TagalogDictionaryScraper._parse_words(page)
 
 
 class TagalogDictionaryScraper:
@@ -17,7 +50,9 @@ class TagalogDictionaryScraper:
     url = 'https://tagalog.pinoydictionary.com'
     letters = list(ascii_lowercase)
     # Parts of speech extracted from https://www.pinoydictionary.com/js/dictionary.js
-    parts_of_speech = [
+    # Deduplicated and sorted longest first once at class creation so matching
+    # always prefers the longer tag ('n.,zoo.' over 'n.')
+    parts_of_speech = tuple(sorted({
         'n.',
         'syn.',
         'bot.',
@@ -60,7 +95,7 @@ class TagalogDictionaryScraper:
         'v.,inf.',
         'n.,zoo.',
         'adj./adv.'
-    ]
+    }, key=lambda part_of_speech: (-len(part_of_speech), part_of_speech)))
     error_pos_mapping = {
         'adj': 'adj.',
         '[n]': 'n.',
@@ -71,6 +106,74 @@ class TagalogDictionaryScraper:
         'adj./adv.': ['adj,', 'adv.']
     }
 
+    # How long cached responses stay valid, in seconds
+    cache_expire_after = 86400
+    # How many times a throttled or failing URL is retried before giving up
+    max_retries = 5
+    # How many pages per letter are fetched speculatively per wave on the async path
+    pages_per_wave = 30
+    # Shared by both sessions so every response comes back compressed
+    # (HTML shrinks 5-10x on the wire) and with a consistent user agent
+    request_headers = {
+        'Accept-Encoding': 'gzip, deflate',
+        'User-Agent': (
+            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+            '(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36'
+        )
+    }
+
+    # Everything below is invariant across the whole run, so it is compiled once
+    # at class creation instead of per instance (or worse, per call).
+    # Single alternation over all parts of speech; parts_of_speech is already
+    # sorted longest first. The lookarounds keep the old token semantics: a match
+    # must start a whitespace-delimited token and may be followed by at most one
+    # extra character (e.g. a trailing comma) before the token ends.
+    _pos_re = re.compile(
+        r'(?<!\S)({})(?=\S?(?:\s|$))'.format(
+            '|'.join(re.escape(part_of_speech) for part_of_speech in parts_of_speech)
+        )
+    )
+    # Maps matched tags back to the shared class-level string objects so tens of
+    # thousands of parsed words reference one 'n.' instead of one copy each
+    _pos_intern = {part_of_speech: part_of_speech for part_of_speech in parts_of_speech}
+    _sel_word_group = CSSSelector('div.word-group')
+    _sel_word_anchor = CSSSelector('a')
+    _sel_definition = CSSSelector('div.definition p')
+    # Matches pagination hrefs like /list/a/108/ so the last page can be read
+    # straight off the raw page without building an lxml tree
+    _page_link_re = re.compile(r'href="[^"]*/list/([a-z])/(\d+)/"')
+
+    # Only per-run state lives on the instance
+    __slots__ = ('_session', '_http_cache')
+
+    def __init__(self):
+        # One session for every synchronous get so the underlying connection pool
+        # is reused instead of doing a TCP + TLS handshake per URL. The on-disk
+        # cache makes re-runs during development skip the network entirely
+        self._session = requests_cache.CachedSession(
+            'pinoydict_cache',
+            expire_after=self.cache_expire_after
+        )
+        self._session.headers.update(self.request_headers)
+        # Same idea for the async path, keyed manually by URL
+        self._http_cache = diskcache.Cache('./.httpcache')
+
+    def close(self) -> None:
+        """
+        Closes the underlying HTTP session and response cache.
+
+        :rtype: None
+        :return: Nothing
+        """
+        self._session.close()
+        self._http_cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
     # noinspection PyMethodMayBeStatic
     def print_words(self, words: Dict) -> None:
         """
@@ -81,91 +184,202 @@ class TagalogDictionaryScraper:
         :rtype: None
         :return: Nothing
         """
-        with open('../words/tagalog-words.json', 'w') as f:
-            json.dump(words, f, indent=4)
+        with open('../words/tagalog-words.json', 'wb') as f:
+            f.write(orjson.dumps(words, option=orjson.OPT_INDENT_2))
 
-    # noinspection PyMethodMayBeStatic
-    def _get_url_content(self, url: str) -> HTML:
+    def _get_url_content(self, url: str) -> str:
         """
-        Gets content of URL synchronously.
+        Gets content of URL synchronously using the shared session.
 
         :type url: str
         :param url: URL where to get the content
-        :rtype: HTML
-        :return: requests_html.HTML instance
+        :rtype: str
+        :return: Response body
         """
-        session = HTMLSession()
-        response = session.get(url)
+        response = self._session.get(url)
 
-        return response.html
+        return response.text
 
-    def scrape(self, async_scrape: bool = False, max_urls: int = 10) -> Dict:
+    def scrape(self, async_scrape: bool = False, max_urls: int = 16) -> Dict:
         """
         Start scraping here.
 
         :type async_scrape: False
         :param async_scrape: True if scrape asynchronously, False otherwise
         :type max_urls: int
-        :param max_urls: Max URL per getting of page contents to minimize process.
-                         Used only when async_scrape is True
+        :param max_urls: Max concurrent requests. Used only when async_scrape is True
         :rtype: Dict
         :return: Dictionary in the form of {'word': {'part_of_speech': [], definition: ''}
         """
         words = {}
 
-        for letter in self.letters:
-            logging.info('Current Letter: {}'.format(letter))
-            current_url = '{url}/list/{letter}'.format(
-                url=self.url,
-                letter=letter
-            )
-            response = self._get_url_content(current_url)
+        with ProcessPoolExecutor() as executor:
+            for chunk in self._iter_word_chunks(async_scrape, max_urls, executor):
+                words.update(chunk)
 
-            # When an AttributeError occurred, that means that there is only 1 page for that letter
-            try:
-                last_page = response.find('a[title^=Last]', first=True).attrs['href']
-                last_page = last_page.split('/')
-                last_page = int(last_page[-2]) + 1
-            except AttributeError:
-                last_page = 2
+        return words
 
-            urls = self._get_all_urls_by_letter(letter, last_page)
+    def scrape_to_file(self, path: str = '../words/tagalog-words.json',
+                       async_scrape: bool = False, max_urls: int = 16) -> None:
+        """
+        Scrapes and streams words straight to a JSON file.
+        Unlike scrape + print_words, words are written as they are parsed, so
+        neither the full dictionary nor its encoded form is ever held in memory.
 
-            if async_scrape is False:
-                htmls = self._get_pages_content(urls)
-            else:
-                htmls = self._get_pages_content_async(urls, max_urls=max_urls)
+        :type path: str
+        :param path: Where to write the JSON file
+        :type async_scrape: False
+        :param async_scrape: True if scrape asynchronously, False otherwise
+        :type max_urls: int
+        :param max_urls: Max concurrent requests. Used only when async_scrape is True
+        :rtype: None
+        :return: Nothing
+        """
+        with ProcessPoolExecutor() as executor, open(path, 'wb') as f:
+            f.write(b'{')
+            first = True
 
-            words.update(self._get_words_info(htmls))
+            for chunk in self._iter_word_chunks(async_scrape, max_urls, executor):
+                for word, info in chunk:
+                    if not first:
+                        f.write(b',')
 
-        return words
+                    f.write(orjson.dumps(word))
+                    f.write(b':')
+                    f.write(orjson.dumps(info))
+                    first = False
 
-    def _get_all_urls_by_letter(self, letter: str, last_page: int) -> List:
+            f.write(b'}')
+
+    def _iter_word_chunks(self, async_scrape: bool, max_urls: int,
+                          executor: ProcessPoolExecutor) -> Iterator[List[Tuple[str, Dict]]]:
         """
-        Gets all URLs for a letter.
+        Yields batches of (word, info) pairs, one per letter on the sync path and
+        one per page on the async path.
 
-        :type letter:
+        :type async_scrape: bool
+        :param async_scrape: True if scrape asynchronously, False otherwise
+        :type max_urls: int
+        :param max_urls: Max concurrent requests. Used only when async_scrape is True
+        :type executor: ProcessPoolExecutor
+        :param executor: Pool where pages are parsed
+        :rtype: Iterator[List[Tuple[str, Dict]]]
+        :return: Iterator of batches of (word, info) pairs
+        """
+        if async_scrape is False:
+            for letter in self.letters:
+                logger.info('Current Letter: %s', letter)
+                current_url = '{url}/list/{letter}'.format(
+                    url=self.url,
+                    letter=letter
+                )
+                last_page = self._get_last_page(letter, self._get_url_content(current_url))
+                pages = self._get_pages_content(self._iter_letter_urls(letter, last_page))
+                yield list(self._iter_words_info(pages, executor))
+        else:
+            pages = self._get_pages_content_speculative(max_urls=max_urls)
+
+            yield from executor.map(_parse_page, pages, chunksize=4)
+
+    def _get_last_page(self, letter: str, page: str) -> int:
+        """
+        Gets the last page number for a letter from its first listing page.
+
+        :type letter: str
         :param letter: Current letter
-        :type last_page: int
-        :param last_page: Last page for the current letter
-        :rtype: list
-        :rtype: List
-        :return: List of URLs
+        :type page: str
+        :param page: Content of the letter's first listing page
+        :rtype: int
+        :return: Exclusive last page, 2 when the letter only has 1 page
+        """
+        page_numbers = [
+            int(number)
+            for link_letter, number in self._page_link_re.findall(page)
+            if link_letter == letter
+        ]
+
+        if not page_numbers:
+            return 2
+
+        return max(page_numbers) + 1
+
+    def _build_page_url(self, letter: str, page: int) -> str:
+        """
+        Builds the listing URL for one page of a letter.
+
+        :type letter: str
+        :param letter: Current letter
+        :type page: int
+        :param page: Page number, the first page has no number in its URL
+        :rtype: str
+        :return: Listing URL
+        """
+        if page == 1:
+            return '{url}/list/{letter}/'.format(url=self.url, letter=letter)
+
+        return '{url}/list/{letter}/{page}/'.format(url=self.url, letter=letter, page=page)
+
+    def _get_pages_content_speculative(self, max_urls: int = 16) -> List[str]:
         """
-        urls = []
+        Gets every letter's pages without probing last pages first.
+        Requests pages_per_wave pages per letter in one batch and keeps a letter
+        alive for the next wave only while all its requested pages still contain
+        words; pages past the end come back without a word-group and are dropped.
 
-        for current_page in range(1, last_page):
-            if current_page == 1:
-                current_page = ''
+        :type max_urls: int
+        :param max_urls: Max concurrent requests
+        :rtype: List[str]
+        :return: List of page contents that contain words
+        """
+        pages = []
+        active_letters = list(self.letters)
+        first_page = 1
+
+        while active_letters:
+            wave = {
+                letter: [
+                    self._build_page_url(letter, page)
+                    for page in range(first_page, first_page + self.pages_per_wave)
+                ]
+                for letter in active_letters
+            }
+            urls = [url for letter_urls in wave.values() for url in letter_urls]
+            content_by_url = dict(zip(urls, asyncio.run(self._fetch_all(urls, max_urls=max_urls))))
+            active_letters = []
+
+            for letter, letter_urls in wave.items():
+                letter_pages = [
+                    content_by_url[url]
+                    for url in letter_urls
+                    if 'word-group' in content_by_url[url]
+                ]
+                pages.extend(letter_pages)
+
+                # Every speculated page had words, so the letter may have more
+                if len(letter_pages) == len(letter_urls):
+                    active_letters.append(letter)
+
+            first_page += self.pages_per_wave
+
+        return pages
+
+    def _iter_letter_urls(self, letter: str, last_page: int) -> Iterator[str]:
+        """
+        Yields all listing URLs for a letter.
 
-            current_url = '{url}/list/{letter}/{current_page}/'.format(
-                url=self.url,
-                letter=letter,
-                current_page=current_page
-            )
-            urls.append(current_url)
+        :type letter: str
+        :param letter: Current letter
+        :type last_page: int
+        :param last_page: Exclusive last page for the current letter
+        :rtype: Iterator[str]
+        :return: Iterator of URLs, the first page has no number in its URL
+        """
+        base = f'{self.url}/list/{letter}'
 
-        return urls
+        yield f'{base}/'
+
+        for page in range(2, last_page):
+            yield f'{base}/{page}/'
 
     # noinspection PyBroadException
     def _get_pages_content(self, urls):
@@ -173,174 +387,198 @@ class TagalogDictionaryScraper:
 
         for url in urls:
             try:
-                logging.info('Current URL: {}'.format(url))
+                logger.info('Current URL: %s', url)
                 contents.append(self._get_url_content(url))
             except Exception:
-                logging.error('Failed in the URL: {}'.format(url))
-                logging.error(traceback.format_exc())
+                logger.error('Failed in the URL: %s', url)
+                logger.error(traceback.format_exc())
 
                 continue
 
-        return [self._get_url_content(url) for url in urls]
+        return contents
 
     # noinspection PyMethodMayBeStatic
-    def _get_pages_content_async(self, urls: list, max_urls: int = 10) -> List:
+    async def _fetch_all(self, urls: list, max_urls: int = 16) -> List[str]:
         """
-        Gets page content asynchronously.
+        Fetches all URLs concurrently over one shared httpx client.
+        HTTP/2 multiplexes the requests over a few connections instead of one
+        connection per in-flight request.
 
         :type urls: list
         :param urls: List of all URLs
         :type max_urls: int
-        :param max_urls: Max URL per getting of page contents to minimize process.
-        :rtype: list
-        :return: List of Page Contents/HTML
+        :param max_urls: Max concurrent requests
+        :rtype: List[str]
+        :return: List of response bodies
         """
-        def create_coroutines(url: str) -> Callable:
-            """
-            Creates async functions for Async get and render
-
-            :type url: str
-            :param url: URL to get and render
-            :rtype: list
-            :return: Async Function that gets a url and renders it
-            """
-            async def coroutine():
-                response = await AsyncHTMLSession().get(url)
-
-                return response
-
-            return coroutine
-
-        def chunk_list(l: list, n: int) -> Generator:
-            """
-            Yields successive n-sized chunks from a list.
-
-            :type l: list
-            :param l: List to be chunked
-            :type n: int
-            :param n: Size per chunk
-            :rtype: Generator
-            :return: Chunked list
-            """
-            for i in range(0, len(l), n):
-                yield l[i:i + n]
-
-        chunk_urls = chunk_list(urls, max_urls)
-        all_results = []
-
-        for chunk in chunk_urls:
-            results = AsyncHTMLSession().run(*(create_coroutines(url) for url in chunk))
-            all_results.extend([result.html for result in results])
-
-        return all_results
-
-    # noinspection PyMethodMayBeStatic
-    def _get_parts_of_speech(self, parts_of_speech: Element) -> List[str]:
+        limits = httpx.Limits(max_connections=max_urls, max_keepalive_connections=max_urls)
+        semaphore = asyncio.Semaphore(max_urls)
+
+        # follow_redirects matches the previous aiohttp/requests behaviour;
+        # httpx does not follow redirects by default
+        async with httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            limits=limits,
+            headers=self.request_headers
+        ) as client:
+            async def fetch(url: str, attempt: int = 0) -> str:
+                key = hashlib.sha1(url.encode()).hexdigest()
+                cached = self._http_cache.get(key)
+
+                if cached is not None:
+                    return cached
+
+                async with semaphore:
+                    logger.info('Current URL: %s', url)
+                    response = await client.get(url)
+
+                # Only 2xx bodies are real content. 404 is kept as well so
+                # speculative pages past the end are remembered by the cache.
+                # Anything else (429 throttling, 403 anti-bot blocks, 5xx) gets
+                # backed off and retried rather than cached as a fake empty page
+                if response.status_code < 300 or response.status_code == 404:
+                    text = response.text
+                    self._http_cache.set(key, text, expire=self.cache_expire_after)
+
+                    return text
+
+                if attempt >= self.max_retries:
+                    response.raise_for_status()
+
+                status = response.status_code
+
+                # Back off outside the semaphore so a throttled URL does not hold
+                # a concurrency slot while sleeping
+                delay = 2 ** attempt + random.random()
+                logger.warning('Got %s for %s, retrying in %.1fs', status, url, delay)
+                await asyncio.sleep(delay)
+
+                return await fetch(url, attempt + 1)
+
+            return await asyncio.gather(*(fetch(url) for url in urls))
+
+    @classmethod
+    def _get_parts_of_speech(cls, definition_text: str) -> List[str]:
         """
         Gets the parts of speech of current word.
         Extracts the parts of speech from the definition because it is not properly stated.
 
-        :type parts_of_speech: Element
-        :param parts_of_speech: Element find inside div.definition p.
+        :type definition_text: str
+        :param definition_text: Text of the div.definition p element
         :rtype: List[str]
         :return: List of Part of Speech Tags
         """
-        indices_pos_mapping = {}
-        tokens = parts_of_speech.text.split()
-
-        for part_of_speech in self.parts_of_speech:
-            for index, token in enumerate(tokens):
-                # Check if the current token contains part of speech like text
-                # Also check if the current token doesn't exceed the part of speech length
-                if token.startswith(part_of_speech) and len(token) < len(part_of_speech) + 2:
-                    indices_pos_mapping[index] = part_of_speech
+        # One linear pass over the text instead of one scan per known part of speech.
+        # finditer yields matches in order, so the last match is the part of speech
+        # nearest to the definition
+        matches = [cls._pos_intern[match.group(1)] for match in cls._pos_re.finditer(definition_text)]
 
-        # max_index means that this part of speech is the nearest to the definition
-        max_index = max(indices_pos_mapping.keys())
-        # remove it from the part of speech by index mapping for now to append it as the last part of speech
-        last_part_of_speech = indices_pos_mapping.pop(max_index)
-        parts_of_speech = [part_of_speech for part_of_speech in indices_pos_mapping.values()]
-        parts_of_speech.append(last_part_of_speech)
+        if not matches:
+            raise ValueError('No part of speech found in: {}'.format(definition_text))
 
-        return parts_of_speech
+        return matches
 
-    def _clean_parts_of_speech(self, parts_of_speech: List[str]) -> List[str]:
+    @classmethod
+    def _clean_parts_of_speech(cls, parts_of_speech: List[str]) -> Tuple[str, ...]:
         """
         Cleans parts of speech that has errors.
+        Returns a tuple of the shared class-level tag strings, so the per-word
+        payload holds no fresh string or list objects.
 
         :type parts_of_speech: List[str]
         :param parts_of_speech: List of parts of speech
-        :rtype: List[str]
+        :rtype: Tuple[str, ...]
         :return: Cleaned/Fixed parts of speech
         """
         cleaned_parts_of_speech = []
 
         for part_of_speech in parts_of_speech:
-            if part_of_speech not in self.error_pos_mapping:
+            if part_of_speech not in cls.error_pos_mapping:
                 cleaned_parts_of_speech.append(part_of_speech)
                 continue
 
-            part_of_speech = self.error_pos_mapping[part_of_speech]
+            part_of_speech = cls.error_pos_mapping[part_of_speech]
 
             if isinstance(part_of_speech, str):
                 cleaned_parts_of_speech.append(part_of_speech)
             elif isinstance(part_of_speech, list):
                 cleaned_parts_of_speech.extend(part_of_speech)
 
-        return cleaned_parts_of_speech
+        return tuple(cleaned_parts_of_speech)
 
-    # noinspection PyMethodMayBeStatic
-    def _get_definition(self, definition: Element, part_of_speech: str) -> str:
+    @staticmethod
+    def _get_definition(definition_text: str, part_of_speech: str) -> str:
         """
         Gets the definition for the current word.
         The definition was split by the last part of speech because the structure of the definition is
         word part_of_speech definition
-        So to get the definition, just split by part of speech then get the last element
+        So to get the definition, take everything after the last occurrence of the part of speech.
+        rpartition scans once from the right without building a list of every split.
 
-        :type definition: Element
-        :param definition: Element from .find
+        :type definition_text: str
+        :param definition_text: Text of the div.definition p element
         :type part_of_speech: str
         :param part_of_speech: str where to split on
         :rtype: str
         :return: Word definition
         """
-        return definition.text.split(part_of_speech)[-1].strip()
+        return definition_text.rpartition(part_of_speech)[2].strip()
 
-    def _get_words_info(self, htmls: List[HTML]) -> Dict:
+    def _iter_words_info(self, pages: List[str], executor: ProcessPoolExecutor) -> Iterator[Tuple[str, Dict]]:
+        """
+        Gets all words by parsing pages in parallel across worker processes.
+        Yields pairs so the caller fills one dictionary instead of merging a
+        fresh dictionary per page.
+
+        :type pages: List[str]
+        :param pages: List of page contents
+        :type executor: ProcessPoolExecutor
+        :param executor: Pool where pages are parsed
+        :rtype: Iterator[Tuple[str, Dict]]
+        :return: Iterator of (word, {'part_of_speech': [], definition: ''}) pairs
         """
-        Gets all words
+        return chain.from_iterable(executor.map(_parse_page, pages, chunksize=4))
 
-        :type htmls: List[HTML]
-        :param htmls: List of HTMLs
-        :rtype: Dict
-        :return: Dictionary in the form of {'word': {'part_of_speech': [], definition: ''}
+    @classmethod
+    def _parse_words(cls, page: str) -> List[Tuple[str, Dict]]:
         """
-        words = {}
+        Parses all words of a single page.
 
-        for html in htmls:
-            word_group = html.find('div.word-group')
-
-            for group in word_group:
-                word = group.find('a', first=True).text
-                definition_html = group.find('div.definition p', first=True)
-                parts_of_speech = self._get_parts_of_speech(definition_html)
-                definition = self._get_definition(definition_html, parts_of_speech[-1])
-                parts_of_speech = self._clean_parts_of_speech(parts_of_speech)
-                words[word] = {
-                    'parts_of_speech': parts_of_speech,
-                    'definition': definition
-                }
-                logging.info('Original Text: {} Word: {} Part of Speech: {} Definition: {}'.format(
-                    definition_html.text,
+        :type page: str
+        :param page: Page content
+        :rtype: List[Tuple[str, Dict]]
+        :return: List of (word, {'part_of_speech': [], definition: ''}) pairs
+        """
+        words = []
+        tree = lxml_html.fromstring(page)
+        log_words = logger.isEnabledFor(logging.INFO)
+
+        for group in cls._sel_word_group(tree):
+            word = cls._sel_word_anchor(group)[0].text_content().strip()
+            # text_content walks the subtree, so extract it once
+            # and hand the plain string to the helpers
+            definition_text = cls._sel_definition(group)[0].text_content().strip()
+            parts_of_speech = cls._get_parts_of_speech(definition_text)
+            definition = cls._get_definition(definition_text, parts_of_speech[-1])
+            parts_of_speech = cls._clean_parts_of_speech(parts_of_speech)
+            words.append((word, {
+                'parts_of_speech': parts_of_speech,
+                'definition': definition
+            }))
+
+            if log_words:
+                logger.info(
+                    'Original Text: %s Word: %s Part of Speech: %s Definition: %s',
+                    definition_text,
                     word,
                     parts_of_speech,
                     definition
-                ))
+                )
 
         return words
 
 
 if __name__ == '__main__':
     t = TagalogDictionaryScraper()
-    w = t.scrape(async_scrape=True, max_urls=500)
-    t.print_words(w)
+    t.scrape_to_file(async_scrape=True, max_urls=16)